@@ -9,72 +9,394 @@ Typical use:
 """
 
 from __future__ import annotations
-import socket, json, textwrap
-from time import sleep
-from robot_configs import get_robot_config
+import socket, json, textwrap, contextlib, threading, base64, sys, asyncio, re
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from robot_configs import RobotCfg, get_robot_config
 import logging
 
+try:
+    # Optional: orjson parses replies several times faster and reads bytes
+    # directly. Its JSONDecodeError subclasses ValueError like the stdlib's.
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_RECV_BUFSIZE = 65536   # initial reply buffer; most replies fit without growing
+# NameError text for a _dof_* helper the bridge no longer has (Isaac Sim restarted)
+_MISSING_HELPER = re.compile(r"name '_dof_\w+' is not defined")
+
+# --------------------------------------------------------------------- #
+# Script templates – dedented once at import, filled with str.format per call
+# --------------------------------------------------------------------- #
+_TPL_ADD_GROUND = textwrap.dedent("""
+    import omni.usd
+    from pxr import UsdGeom
+    import json
+
+    try:
+        # Ensure we have a stage
+        ctx  = omni.usd.get_context()
+        stage = ctx.get_stage() or ctx.new_stage()
+
+        # Remove an existing plane of the same name (idempotent)
+        path = "/World/GroundPlane"
+        if stage.GetPrimAtPath(path):
+            stage.RemovePrim(path)
+
+        # Build a square mesh
+        plane = UsdGeom.Mesh.Define(stage, path)
+        extent = {extent:.4f}
+        plane.CreatePointsAttr([
+            (-extent, -extent, 0), ( extent, -extent, 0),
+            ( extent,  extent, 0), (-extent,  extent, 0)
+        ])
+        plane.CreateFaceVertexCountsAttr([4])
+        plane.CreateFaceVertexIndicesAttr([0, 1, 2, 3])
+        omni.usd.get_context().wait_for_idle()
+        
+        # Print success response
+        result = {{"status": "success", "message": "Ground plane added successfully"}}
+        print(json.dumps(result))
+    except Exception as e:
+        # Print error response
+        result = {{"status": "error", "message": str(e)}}
+        print(json.dumps(result))
+""")
+
+_TPL_ADD_ROBOT = textwrap.dedent("""
+    import omni.usd
+    import json
+
+    try:
+        ctx   = omni.usd.get_context()
+        stage = ctx.get_stage() or ctx.new_stage()
+
+        # Replace any existing robot prim
+        if stage.GetPrimAtPath("{prim_path}"):
+            stage.RemovePrim("{prim_path}")
+
+        # Any cached articulation view points at the prim being replaced
+        globals().get("_DOF_ARTIC_CACHE", {{}}).pop("{prim_path}", None)
+
+        # Reference the remote USD
+        stage.DefinePrim("{prim_path}", "Xform")\\
+             .GetReferences().AddReference("{usd_path}")
+
+        omni.usd.get_context().wait_for_idle()
+        result = {{"status": "success", "message": "Robot {name} referenced from {usd_path}"}}
+    except Exception as e:
+        result = {{"status": "error", "message": str(e)}}
+    print(json.dumps(result))
+""")
+
+_TPL_ADD_BALL = textwrap.dedent("""
+    import omni.usd, omni.kit.app
+    from pxr import UsdGeom, Gf
+    import json
+
+    try:
+        ctx   = omni.usd.get_context()
+        stage = ctx.get_stage() or ctx.new_stage()
+
+        if not stage.GetPrimAtPath("{prim_path}"):
+            sphere = UsdGeom.Sphere.Define(stage, "{prim_path}")
+            sphere.GetRadiusAttr().Set({radius})
+            sphere.AddTranslateOp().Set(Gf.Vec3f({x}, {y}, {z}))
+        else:
+            sphere = UsdGeom.Sphere(stage.GetPrimAtPath("{prim_path}"))
+            sphere.GetRadiusAttr().Set({radius})
+
+        if {render}:
+            # One app tick flushes the new prim to the viewport
+            omni.kit.app.get_app().update()
+        omni.usd.get_context().wait_for_idle()
+
+        # Print success response
+        result = {{"status": "success", "message": "Ball added/updated successfully at {prim_path}"}}
+        print(json.dumps(result))
+    except Exception as e:
+        # Print error response
+        result = {{"status": "error", "message": str(e)}}
+        print(json.dumps(result))
+""")
+
+# Joint helpers are defined once inside Isaac Sim's interpreter; after that
+# each joint command is a single call line instead of a full script.
+_SCRIPT_JOINT_HELPERS = textwrap.dedent("""
+    from omni.isaac.core.articulations import ArticulationView
+    import json, math
+
+    _DOF_ARTIC_CACHE = globals().get("_DOF_ARTIC_CACHE", {})
+
+    def _dof_view(prim_path, name):
+        # Reuse the articulation initialized by an earlier call
+        view = _DOF_ARTIC_CACHE.get(prim_path)
+        if view is None:
+            view = ArticulationView(prim_paths_expr=prim_path, name=name)
+            view.initialize()
+            _DOF_ARTIC_CACHE[prim_path] = view
+        return view
+
+    def _dof_with_view(prim_path, name, use):
+        # A cached view can go stale (e.g. after a timeline stop/play): drop
+        # it and retry once on a freshly built view before giving up
+        cached = prim_path in _DOF_ARTIC_CACHE
+        try:
+            return use(_dof_view(prim_path, name))
+        except Exception:
+            _DOF_ARTIC_CACHE.pop(prim_path, None)
+            if not cached:
+                raise
+        return use(_dof_view(prim_path, name))
+
+    def _dof_set_joint_state(prim_path, name, positions, velocities):
+        def use(view):
+            if positions is not None:
+                view.set_joint_positions(positions=positions)
+            if velocities is not None:
+                view.set_joint_velocities(velocities=velocities)
+
+        try:
+            _dof_with_view(prim_path, name, use)
+            what = " and ".join(
+                label for label, values in (("positions", positions), ("velocities", velocities))
+                if values is not None
+            )
+            result = {"status": "success", "message": f"Set joint {what} for {name}"}
+        except Exception as e:
+            # Drop the failed view so the next call rebuilds it
+            _DOF_ARTIC_CACHE.pop(prim_path, None)
+            result = {"status": "error", "message": str(e)}
+        print(json.dumps(result))
+
+    def _dof_finite(values):
+        # NaN/inf (e.g. after a physics blow-up) -> None, so the reply is
+        # strict JSON that any client-side parser (orjson included) accepts
+        if isinstance(values, list):
+            return [_dof_finite(v) for v in values]
+        return values if math.isfinite(values) else None
+
+    def _dof_get_joint_states(prim_path, name):
+        try:
+            # clone=False: the buffers are only read and serialized right here
+            result = {
+                "status": "success",
+                "data": _dof_with_view(prim_path, name, lambda view: {
+                    "positions": _dof_finite(view.get_joint_positions(clone=False).tolist()),
+                    "velocities": _dof_finite(view.get_joint_velocities(clone=False).tolist()),
+                }),
+            }
+        except Exception as e:
+            _DOF_ARTIC_CACHE.pop(prim_path, None)
+            result = {"status": "error", "message": str(e)}
+        print(json.dumps(result, separators=(",", ":")))
+
+    def _dof_f32(values):
+        # Little-endian float32 bytes, base64'd to fit the bridge's JSON reply
+        import base64, numpy as np
+        if hasattr(values, "cpu"):
+            values = values.cpu().numpy()
+        return base64.b64encode(np.asarray(values, dtype="<f4").tobytes()).decode("ascii")
+
+    def _dof_get_joint_states_packed(prim_path, name):
+        try:
+            result = {
+                "status": "success",
+                "data": _dof_with_view(prim_path, name, lambda view: {
+                    "positions": _dof_f32(view.get_joint_positions(clone=False)),
+                    "velocities": _dof_f32(view.get_joint_velocities(clone=False)),
+                }),
+            }
+        except Exception as e:
+            _DOF_ARTIC_CACHE.pop(prim_path, None)
+            result = {"status": "error", "message": str(e)}
+        print(json.dumps(result, separators=(",", ":")))
+
+    print('{"status": "success", "message": "Joint helpers registered"}')
+""")
+
+# Set calls are stored per robot up to the open argument list; only the
+# joint vectors and the closing paren are appended per call.
+_TPL_CALL_SET_STATE = "_dof_set_joint_state({prim_path!r}, {robot_name!r}, "
+_TPL_CALL_GET_STATE = "_dof_get_joint_states({prim_path!r}, {robot_name!r})"
+_TPL_CALL_GET_STATE_PACKED = "_dof_get_joint_states_packed({prim_path!r}, {robot_name!r})"
+
+_SCRIPT_LIST_ROBOTS = textwrap.dedent("""
+    import omni.usd
+    from pxr import Usd, UsdPhysics
+    import json
+    import sys
+    import omni.kit.app
+
+    try:
+        # Update app to ensure stage is up to date
+        omni.kit.app.get_app().update()
+
+        stage = omni.usd.get_context().get_stage()
+        if not stage:
+            response = {"status": "success", "data": []}
+        else:
+            robots = []
+            # Find all articulation roots in the scene
+            for prim in stage.Traverse():
+                if prim.HasAPI(UsdPhysics.ArticulationRootAPI):
+                    robots.append(prim.GetPath().pathString)
+            
+            response = {"status": "success", "data": robots}
+
+        print(json.dumps(response))
+        sys.stdout.flush()
+        omni.usd.get_context().wait_for_idle()
+
+    except Exception as e:
+        # Print error response
+        error_response = {"status": "error", "message": str(e)}
+        print(json.dumps(error_response))
+        sys.stdout.flush()
+""")
+
+_SCRIPT_STAGE_PROBE = textwrap.dedent("""
+    import omni.usd
+    ctx = omni.usd.get_context()
+    ctx.get_stage() or ctx.new_stage()
+    ctx.wait_for_idle()
+    print('{"status": "success", "message": "Stage ready"}')
+""")
+
+_TPL_BATCH = textwrap.dedent("""
+    import contextlib, io, json
+    _dof_results = []
+    for _dof_step in {steps!r}:
+        _dof_out = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(_dof_out):
+                exec(_dof_step, globals())
+            _dof_results.append(_dof_out.getvalue().strip())
+        except Exception as e:
+            _dof_results.append(json.dumps({{"status": "error", "message": str(e)}}))
+    print(json.dumps({{"status": "success", "data": _dof_results}}))
+""")
+
+def _unpack_f32(encoded: str) -> array:
+    """Decode a base64 little-endian float32 buffer from the bridge."""
+    values = array("f", base64.b64decode(encoded))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def _sendall_parts(sock: socket.socket, parts: tuple[bytes, ...]) -> None:
+    """
+    sendall() for several buffers: scatter-gather them with sendmsg so the
+    kernel sees one write, resuming after partial sends. Platforms without
+    sendmsg get a single joined sendall instead.
+    """
+    if not hasattr(sock, "sendmsg"):
+        sock.sendall(b"".join(parts))
+        return
+    views = [memoryview(part) for part in parts if part]
+    while views:
+        sent = sock.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            views.pop(0)
+        if sent:
+            views[0] = views[0][sent:]
+
+def _floats(values):
+    """Nested sequences/arrays of numbers -> nested lists of floats."""
+    if hasattr(values, "tolist"):       # numpy arrays and scalars, torch tensors
+        values = values.tolist()
+    if isinstance(values, (list, tuple)):
+        return [_floats(v) for v in values]
+    if isinstance(values, (str, bytes, bool)) or values is None:
+        raise ValueError(f"Joint values must be numbers, got {values!r}")
+    try:
+        return [_floats(v) for v in iter(values)]
+    except TypeError:
+        pass
+    try:
+        return float(values)
+    except (TypeError, ValueError):
+        raise ValueError(f"Joint values must be numbers, got {values!r}") from None
+
+def _float_list(values) -> str:
+    """
+    Render a joint vector as a compact JSON array, which is also a valid
+    Python list literal. Accepts flat or nested (e.g. ``(M, K)``, as
+    returned by get_joint_states) sequences and numpy arrays of numbers,
+    and raises ValueError for non-numbers and NaN/inf before anything is
+    sent.
+    """
+    floats = _floats(values)
+    if not isinstance(floats, list):
+        raise ValueError(f"Joint values must be a sequence, got {values!r}")
+    return json.dumps(floats, allow_nan=False, separators=(",", ":"))
+
 class DOF:
     """One object = one convenience handle to a running Isaac Sim instance."""
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 8226) -> None:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8226,
+        socket_options: list[tuple[int, int, int]] | None = None,
+        max_inflight: int = 8,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        socket_options : list[tuple[int, int, int]], optional
+            Extra ``(level, optname, value)`` triples applied to every bridge
+            socket before connecting, e.g. ``(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)``.
+        max_inflight : int
+            How many ``*_async`` commands may be queued or in flight before
+            the next one blocks the caller.
+        """
         self.host, self.port = host, port
+        self.socket_options = list(socket_options or [])
+        self._addrs: list[tuple] | None = None       # getaddrinfo() result, resolved on first connect
+        self._stage_ready = False
+        self._helpers_ready = False
+        self._robot_calls: dict[str, tuple[RobotCfg, dict[str, str]]] = {}
+        self._local = threading.local()             # per-thread batch() queue
+        self._sender: ThreadPoolExecutor | None = None  # started by the first *_async call
+        self._inflight = threading.BoundedSemaphore(max_inflight)
+
+    def __enter__(self) -> DOF:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Wait for queued ``*_async`` commands to finish and stop the sender thread."""
+        if self._sender is not None:
+            self._sender.shutdown(wait=True)
+            self._sender = None
 
     # --------------------------------------------------------------------- #
     # PUBLIC API – call these from user code
     # --------------------------------------------------------------------- #
 
-    def add_ground(self, size: float = 400.0) -> str:
+    def add_ground(self, size: float = 400.0) -> dict:
         """
         Adds a simple textured ground plane (size x size metres) at Z = 0.
 
         Returns
         -------
-        str : whatever Isaac Sim prints while executing the snippet.
+        dict : the decoded reply, e.g. ``{"status": "success", "message": ...}``
         """
-        sleep(2)
-        script = textwrap.dedent(f"""
-            import omni.usd
-            from pxr import UsdGeom
-            import json
-
-            try:
-                # Ensure we have a stage
-                ctx  = omni.usd.get_context()
-                stage = ctx.get_stage() or ctx.new_stage()
-
-                # Remove an existing plane of the same name (idempotent)
-                path = "/World/GroundPlane"
-                if stage.GetPrimAtPath(path):
-                    stage.RemovePrim(path)
-
-                # Build a square mesh
-                plane = UsdGeom.Mesh.Define(stage, path)
-                extent = {size / 2:.4f}
-                plane.CreatePointsAttr([
-                    (-extent, -extent, 0), ( extent, -extent, 0),
-                    ( extent,  extent, 0), (-extent,  extent, 0)
-                ])
-                plane.CreateFaceVertexCountsAttr([4])
-                plane.CreateFaceVertexIndicesAttr([0, 1, 2, 3])
-                omni.usd.get_context().wait_for_idle()
-                
-                # Print success response
-                result = {{"status": "success", "message": "Ground plane added successfully"}}
-                print(json.dumps(result))
-            except Exception as e:
-                # Print error response
-                result = {{"status": "error", "message": str(e)}}
-                print(json.dumps(result))
-        """)
+        self._ensure_stage()
+        script = _TPL_ADD_GROUND.format(extent=size / 2)
         result = self._exec(script)
         logger.info("✔ Ground plane added")
         return result
     
-    def add_robot(self, robot_name: str) -> str:
+    def add_robot(self, robot_name: str) -> dict:
         """
         References a robot into the stage.
 
@@ -84,29 +406,16 @@ class DOF:
             Name of the robot to add (e.g. "franka", "ur5", etc.)
             See robot_configs.py for available robots.
         """
-        sleep(2)
-        
-        # Get robot configuration
-        config = get_robot_config(robot_name)
+        self._ensure_stage()
+
+        # Get robot configuration; also pre-renders the joint calls for it
+        config, _ = self._calls_for(robot_name)
         
-        script = textwrap.dedent(f"""
-            import omni.usd
-            ctx   = omni.usd.get_context()
-            stage = ctx.get_stage() or ctx.new_stage()
-
-            # Replace any existing robot prim
-            if stage.GetPrimAtPath("{config['prim_path']}"):
-                stage.RemovePrim("{config['prim_path']}")
-
-            # Reference the remote USD
-            stage.DefinePrim("{config['prim_path']}", "Xform")\\
-                 .GetReferences().AddReference("{config['usd_path']}")
-
-            omni.usd.get_context().wait_for_idle()
-            print("Robot {config['name']} referenced from {config['usd_path']}")
-        """)
+        script = _TPL_ADD_ROBOT.format(
+            prim_path=config.prim_path, usd_path=config.usd_path, name=config.name
+        )
         result = self._exec(script)
-        logger.info(f"✔ Robot {config['name']} added")
+        logger.info("✔ Robot %s added", config.name)
         return result
 
     def add_ball(
@@ -114,45 +423,65 @@ class DOF:
         prim_path: str = "/World/InjectedSphere",
         radius: float = 6.0,
         translate: tuple[float, float, float] = (0, 0, 20),
-    ) -> str:
-        """Add or update a sphere prim."""
-        x, y, z = translate
-        script = textwrap.dedent(f"""
-            import omni.usd, omni.timeline, omni.kit.app
-            from pxr import UsdGeom, Gf
-            import json
+        render: bool = False,
+    ) -> dict:
+        """
+        Add or update a sphere prim.
 
-            try:
-                ctx   = omni.usd.get_context()
-                stage = ctx.get_stage() or ctx.new_stage()
-
-                if not stage.GetPrimAtPath("{prim_path}"):
-                    sphere = UsdGeom.Sphere.Define(stage, "{prim_path}")
-                    sphere.GetRadiusAttr().Set({radius})
-                    sphere.AddTranslateOp().Set(Gf.Vec3f({x}, {y}, {z}))
-                else:
-                    sphere = UsdGeom.Sphere(stage.GetPrimAtPath("{prim_path}"))
-                    sphere.GetRadiusAttr().Set({radius})
-
-                omni.timeline.get_timeline_interface().play()
-                omni.kit.app.get_app().update()
-                omni.timeline.get_timeline_interface().stop()
-                omni.usd.get_context().wait_for_idle()
-
-                # Print success response
-                result = {{"status": "success", "message": "Ball added/updated successfully at {prim_path}"}}
-                print(json.dumps(result))
-            except Exception as e:
-                # Print error response
-                result = {{"status": "error", "message": str(e)}}
-                print(json.dumps(result))
-        """)
-        sleep(2)
+        Set *render* to tick the app once so the viewport shows the sphere
+        immediately. Otherwise the prim is only authored, without waiting
+        for a frame.
+        """
+        self._ensure_stage()
+        x, y, z = translate
+        script = _TPL_ADD_BALL.format(
+            prim_path=prim_path, radius=radius, x=x, y=y, z=z, render=bool(render)
+        )
         result = self._exec(script)
         logger.info("✔ Ball added")
         return result
 
-    def set_joint_positions(self, robot_name: str, positions: list[float]) -> str:
+    def add_scene(
+        self,
+        ground: bool = True,
+        robots: tuple[str, ...] | list[str] = (),
+        balls: tuple[dict, ...] | list[dict] = (),
+    ) -> list[dict]:
+        """
+        Add a ground plane, robots and balls, overlapping the requests.
+
+        The calls have no ordering dependency between them, so each one is
+        sent on its own connection from a small thread pool. Isaac Sim still
+        executes the scripts one at a time, but connection setup and script
+        transfer overlap. Anything that depends on these prims, such as
+        set_joint_positions, must be called after add_scene returns. Inside a
+        batch() block the calls are queued in order instead.
+
+        Parameters
+        ----------
+        ground : bool
+            Whether to add the ground plane
+        robots : sequence of str
+            Robot names to add (see robot_configs.py)
+        balls : sequence of dict
+            Keyword arguments for one add_ball call each
+
+        Returns
+        -------
+        list[dict] : one reply per call, in the order ground, robots, balls.
+        """
+        calls = ([(self.add_ground, {})] if ground else []) \
+            + [(self.add_robot, {"robot_name": name}) for name in robots] \
+            + [(self.add_ball, dict(kwargs)) for kwargs in balls]
+        if self._batch_queue() is not None or len(calls) < 2:
+            return [fn(**kwargs) for fn, kwargs in calls]
+
+        self._ensure_stage()   # probe once up front, not once per worker
+        with ThreadPoolExecutor(max_workers=min(len(calls), 8), thread_name_prefix="dof-scene") as pool:
+            futures = [pool.submit(fn, **kwargs) for fn, kwargs in calls]
+            return [future.result() for future in futures]
+
+    def set_joint_positions(self, robot_name: str, positions: list[float]) -> dict:
         """
         Set target joint positions for a robot.
 
@@ -163,34 +492,35 @@ class DOF:
         positions : list[float]
             Target joint positions in radians, must match number of robot joints
         """
-        config = get_robot_config(robot_name)
-        script = textwrap.dedent(f"""
-            import omni.isaac.core.utils.prims as prim_utils
-            from omni.isaac.core.articulations import ArticulationView
-            import json
+        return self.set_joint_state(robot_name, positions=positions)
 
-            try:
-                # Get the robot articulation
-                robot = ArticulationView(prim_paths_expr="{config['prim_path']}", name="{robot_name}")
-                robot.initialize()
-
-                # Set joint positions 
-                robot.set_joint_positions(positions={positions})
-                
-                # Format success response
-                response = {{"status": "ok", "output": json.dumps({{"status": "success", "message": f"Set joint positions for {robot_name}"}})}}
-            except Exception as e:
-                # Format error response
-                response = {{"status": "ok", "output": json.dumps({{"status": "error", "message": str(e)}})}}
-            
-            # Print the response
-            print(json.dumps(response))
-        """)
-        result = self._exec(script)
-        logger.info(f"✔ Joint positions command sent for {config['name']}")
-        return result
-
-    def set_joint_velocities(self, robot_name: str, velocities: list[float]) -> str:
+    def set_joint_positions_async(self, robot_name: str, positions: list[float]) -> Future:
+        """
+        Like set_joint_positions, but return as soon as the command is queued.
+
+        A single background thread sends the commands in call order, one
+        connection at a time: each command goes out only after the previous
+        reply has arrived. Throughput therefore stays at one round trip per
+        command; the gain is only that a control loop does not block on each
+        reply before computing the next target.
+        The returned Future resolves to the reply dict. Once *max_inflight*
+        commands are outstanding, this call blocks until one completes.
+        Commands are sent directly and are not captured by batch().
+        """
+        _, call = self._set_state_call(robot_name, positions, None)
+        self._ensure_helpers()
+        self._inflight.acquire()
+        try:
+            if self._sender is None:
+                self._sender = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dof-sender")
+            future = self._sender.submit(self._call_helper, call, self._send)
+        except BaseException:
+            self._inflight.release()
+            raise
+        future.add_done_callback(lambda _: self._inflight.release())
+        return future
+
+    def set_joint_velocities(self, robot_name: str, velocities: list[float]) -> dict:
         """
         Set target joint velocities for a robot.
 
@@ -201,31 +531,40 @@ class DOF:
         velocities : list[float]
             Target joint velocities in radians/second, must match number of robot joints
         """
-        config = get_robot_config(robot_name)
-        script = textwrap.dedent(f"""
-            import omni.isaac.core.utils.prims as prim_utils
-            from omni.isaac.core.articulations import ArticulationView
-            import json
+        return self.set_joint_state(robot_name, velocities=velocities)
 
-            try:
-                # Get the robot articulation
-                robot = ArticulationView(prim_paths_expr="{config['prim_path']}", name="{robot_name}")
-                robot.initialize()
-
-                # Set joint velocities
-                robot.set_joint_velocities(velocities={velocities})
-                
-                result = {{"status": "success", "message": f"Set joint velocities for {robot_name}"}}
-            except Exception as e:
-                result = {{"status": "error", "message": str(e)}}
-            
-            print(json.dumps(result))
-        """)
-        result = self._exec(script)
-        logger.info(f"✔ Joint velocities command sent for {config['name']}")
+    def set_joint_state(
+        self,
+        robot_name: str,
+        positions: list[float] | None = None,
+        velocities: list[float] | None = None,
+    ) -> dict:
+        """
+        Set target joint positions and/or velocities in one round trip.
+
+        Both targets are applied to the same articulation view in a single
+        injected call, so a controller that sets both pays for one request.
+
+        Parameters
+        ----------
+        robot_name : str
+            Name of the robot to control (must match one added with add_robot)
+        positions : list[float], optional
+            Target joint positions in radians
+        velocities : list[float], optional
+            Target joint velocities in radians/second
+        """
+        config, call = self._set_state_call(robot_name, positions, velocities)
+        result = self._call_helper(call)
+        if logger.isEnabledFor(logging.INFO):
+            what = " and ".join(
+                label for label, values in (("positions", positions), ("velocities", velocities))
+                if values is not None
+            )
+            logger.info("✔ Joint %s command sent for %s", what, config.name)
         return result
 
-    def get_joint_states(self, robot_name: str) -> str:
+    def get_joint_states(self, robot_name: str) -> dict:
         """
         Get current joint positions and velocities for a robot.
 
@@ -236,132 +575,404 @@ class DOF:
         
         Returns
         -------
-        str : JSON string containing joint positions and velocities
+        dict : ``{"status": "success", "data": {"positions": [...], "velocities": [...]}}``
+            Non-finite values (NaN/inf) come back as ``None``.
         """
-        config = get_robot_config(robot_name)
-        script = textwrap.dedent(f"""
-            import omni.isaac.core.utils.prims as prim_utils
-            from omni.isaac.core.articulations import ArticulationView
-            import json
+        config, calls = self._calls_for(robot_name)
+        call = calls["get_state"]
+        result = self._call_helper(call)
+        logger.info("✔ Got joint states for %s", config.name)
+        return result
 
-            try:
-                # Get the robot articulation
-                robot = ArticulationView(prim_paths_expr="{config['prim_path']}", name="{robot_name}")
-                robot.initialize()
-
-                # Get current state
-                positions = robot.get_joint_positions().tolist()
-                velocities = robot.get_joint_velocities().tolist()
-                
-                # Return as JSON string
-                result = {{
-                    "status": "success",
-                    "data": {{
-                        "positions": positions,
-                        "velocities": velocities
-                    }}
-                }}
-            except Exception as e:
-                result = {{"status": "error", "message": str(e)}}
-            
-            print(json.dumps(result))
-        """)
-        result = self._exec(script)
-        logger.info(f"✔ Got joint states for {config['name']}")
+    def get_joint_states_packed(self, robot_name: str) -> tuple[array, array]:
+        """
+        Get joint positions and velocities as float32 arrays.
+
+        Isaac Sim sends each buffer as base64-encoded float32 instead of a
+        JSON list of floats, which shrinks the reply and skips per-float
+        parsing when polling at high rate. Values are flattened row-major
+        and rounded to single precision. Wrap them with
+        ``numpy.frombuffer(arr, dtype=numpy.float32)`` for zero-copy numpy
+        access. This call is sent directly and is not captured by batch().
+
+        Returns
+        -------
+        tuple[array.array, array.array] : (positions, velocities)
+
+        Raises
+        ------
+        RuntimeError : if Isaac Sim reports an error reading the state
+        """
+        config, calls = self._calls_for(robot_name)
+        call = calls["get_state_packed"]
+        response = self._call_helper(call, self._send)
+        if response.get("status") != "success":
+            raise RuntimeError(f"Isaac Sim error: {response.get('message', 'Unknown error')}")
+        data = response["data"]
+        logger.info("✔ Got packed joint states for %s", config.name)
+        return _unpack_f32(data["positions"]), _unpack_f32(data["velocities"])
+
+    async def aset_joint_state(
+        self,
+        robot_name: str,
+        positions: list[float] | None = None,
+        velocities: list[float] | None = None,
+    ) -> dict:
+        """
+        Async version of set_joint_state. The caller's event loop keeps
+        running while the command is in flight. Not captured by batch().
+        """
+        config, call = self._set_state_call(robot_name, positions, velocities)
+        result = await self._acall_helper(call)
+        logger.info("✔ Joint state command sent for %s", config.name)
+        return result
+
+    async def aset_joint_positions(self, robot_name: str, positions: list[float]) -> dict:
+        """Async version of set_joint_positions."""
+        return await self.aset_joint_state(robot_name, positions=positions)
+
+    async def aget_joint_states(self, robot_name: str) -> dict:
+        """Async version of get_joint_states."""
+        config, calls = self._calls_for(robot_name)
+        call = calls["get_state"]
+        result = await self._acall_helper(call)
+        logger.info("✔ Got joint states for %s", config.name)
         return result
 
-    def list_robots(self) -> str:
+    def list_robots(self) -> dict:
         """
         List all robots currently in the scene.
 
         Returns
         -------
-        str : JSON string containing list of robots
+        dict : ``{"status": "success", "data": [<articulation root prim paths>]}``
         """
-        script = textwrap.dedent("""
-            import omni.usd
-            from pxr import Usd, UsdPhysics
-            import json
-            import sys
-            import omni.kit.app
-
-            try:
-                # Update app to ensure stage is up to date
-                omni.kit.app.get_app().update()
-
-                stage = omni.usd.get_context().get_stage()
-                if not stage:
-                    response = {"status": "success", "data": []}
-                else:
-                    robots = []
-                    # Find all articulation roots in the scene
-                    for prim in stage.Traverse():
-                        if prim.HasAPI(UsdPhysics.ArticulationRootAPI):
-                            robots.append(prim.GetPath().pathString)
-                    
-                    response = {"status": "success", "data": robots}
-
-                print(json.dumps(response))
-                sys.stdout.flush()
-                omni.usd.get_context().wait_for_idle()
-
-            except Exception as e:
-                # Print error response
-                error_response = {"status": "error", "message": str(e)}
-                print(json.dumps(error_response))
-                sys.stdout.flush()
-        """)
+        script = _SCRIPT_LIST_ROBOTS
         result = self._exec(script)
         logger.info("✔ Listed robots")
         return result
 
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Queue every call made inside the block and send them to Isaac Sim as
+        a single script when the block exits.
+
+        >>> with sim.batch() as results:
+        ...     sim.add_ground()
+        ...     sim.add_robot("franka")
+        >>> results          # one reply per queued call, in call order
+
+        Calls inside the block return a ``{"status": "queued"}`` placeholder.
+        Only calls made from the thread that opened the block are queued, so
+        other threads can keep using the same handle meanwhile.
+        A failing step records its own error reply and does not stop the
+        steps after it. If the block raises, nothing is sent.
+        """
+        if self._batch_queue() is not None:
+            raise RuntimeError("DOF.batch() blocks cannot be nested")
+        self._local.pending = []
+        results: list[dict] = []
+        try:
+            yield results
+            steps = self._local.pending
+        finally:
+            self._local.pending = None
+        if steps:
+            results.extend(self._send_batch(steps))
+            logger.info("✔ Batch of %d calls executed", len(steps))
+
+    # --------------------------------------------------------------------- #
+    # PRIVATE – stage readiness
+    # --------------------------------------------------------------------- #
+    def _ensure_stage(self) -> None:
+        """
+        Block once until Isaac Sim has a stage and is idle; later scene edits
+        skip the probe.
+        """
+        if self._stage_ready:
+            return
+        self._send(_SCRIPT_STAGE_PROBE)
+        self._stage_ready = True
+
+    # --------------------------------------------------------------------- #
+    # PRIVATE – joint helpers registered inside Isaac Sim
+    # --------------------------------------------------------------------- #
+    def _set_state_call(
+        self,
+        robot_name: str,
+        positions: list[float] | None,
+        velocities: list[float] | None,
+    ) -> tuple[RobotCfg, str]:
+        """Build the one-line _dof_set_joint_state call for *robot_name*."""
+        if positions is None and velocities is None:
+            raise ValueError("At least one of positions or velocities must be given")
+        config, calls = self._calls_for(robot_name)
+        call = "".join((
+            calls["set_state"],
+            "None" if positions is None else _float_list(positions),
+            ", ",
+            "None" if velocities is None else _float_list(velocities),
+            ")",
+        ))
+        return config, call
+
+    def _calls_for(self, robot_name: str) -> tuple[RobotCfg, dict[str, str]]:
+        """
+        Resolve *robot_name* and render its helper call strings once; joint
+        commands then only append their vectors.
+        """
+        cached = self._robot_calls.get(robot_name)
+        if cached is None:
+            config = get_robot_config(robot_name)
+            fields = {"prim_path": config.prim_path, "robot_name": robot_name}
+            cached = config, {
+                "set_state": _TPL_CALL_SET_STATE.format(**fields),
+                "get_state": _TPL_CALL_GET_STATE.format(**fields),
+                "get_state_packed": _TPL_CALL_GET_STATE_PACKED.format(**fields),
+            }
+            self._robot_calls[robot_name] = cached
+        return cached
+
+    def _ensure_helpers(self) -> None:
+        """Define the _dof_* joint helpers in the bridge's globals once."""
+        if self._helpers_ready:
+            return
+        self._send(_SCRIPT_JOINT_HELPERS)
+        self._helpers_ready = True
+
+    def _call_helper(self, call: str, send=None) -> dict:
+        """
+        Run a one-line helper *call* through *send* (``_exec`` by default).
+        If Isaac Sim was restarted, the helpers are gone and the call fails
+        with a NameError. In that case register them again and retry once;
+        any other bridge error is raised as is, so a command never runs twice.
+        """
+        send = send or self._exec
+        self._ensure_helpers()
+        try:
+            return send(call)
+        except RuntimeError as e:
+            if not _MISSING_HELPER.search(str(e)):
+                raise
+            self._helpers_ready = False
+            self._ensure_helpers()
+            return send(call)
+
     # --------------------------------------------------------------------- #
     # PRIVATE – generic "send a script, get JSON reply"
     # --------------------------------------------------------------------- #
-    def _exec(self, src: str) -> str:
+    def _addresses(self) -> list[tuple]:
         """
-        Low-level helper: send *src* (must end with '\n') and return 'output'
-        from the JSON reply, raising on non-'ok' status.
+        Resolve *host* once and reuse the getaddrinfo() entries (IPv4 and
+        IPv6). The bridge reads a script until EOF and closes after replying,
+        so each call still needs its own connection, but it no longer pays a
+        name lookup as well. If no entry accepts a connection the cache is
+        dropped, so the next call resolves *host* again.
         """
-        src = src.rstrip("\n") + "\n"           # exactly one trailing LF
-        logger.debug(f"Sending script to Isaac Sim:\n{src}")
+        if self._addrs is None:
+            self._addrs = socket.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM)
+        return self._addrs
+
+    def _promote(self, info: tuple) -> None:
+        # Try the address that just worked first on the next connect
+        addrs = self._addrs
+        if addrs and addrs[0] is not info:
+            self._addrs = [info] + [other for other in addrs if other is not info]
+
+    def _new_socket(self, info: tuple) -> socket.socket:
+        """
+        Create a bridge socket for one getaddrinfo() entry, with Nagle
+        disabled: every call is one small script followed by a half-close,
+        so coalescing only adds latency.
+        """
+        family, type_, proto = info[:3]
+        sock = socket.socket(family, type_, proto)
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            for level, optname, value in self.socket_options:
+                sock.setsockopt(level, optname, value)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    @staticmethod
+    def _quickack(sock: socket.socket) -> None:
+        # Linux only: ACK the reply immediately instead of delaying it
+        if hasattr(socket, "TCP_QUICKACK"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+    def _connect(self) -> socket.socket:
+        """
+        Open a connected, tuned bridge socket, trying each resolved address
+        in turn like socket.create_connection.
+        """
+        error: OSError | None = None
+        for info in self._addresses():
+            try:
+                sock = self._new_socket(info)
+            except OSError as e:
+                error = e
+                continue
+            try:
+                sock.connect(info[4])
+                self._quickack(sock)
+            except OSError as e:
+                sock.close()
+                error = e
+                continue
+            self._promote(info)
+            return sock
+        self._addrs = None      # resolve again next time, in case the host moved
+        raise error or OSError(f"getaddrinfo returned no addresses for {self.host}")
+
+    def _batch_queue(self) -> list[str] | None:
+        """Scripts queued by this thread's open batch() block, if any."""
+        return getattr(self._local, "pending", None)
+
+    def _exec(self, src: str) -> dict:
+        """Send *src* now, or queue it if a batch() block is open."""
+        pending = self._batch_queue()
+        if pending is not None:
+            pending.append(src)
+            return {"status": "queued", "message": "Queued in batch"}
+        return self._send(src)
+
+    def _send_batch(self, steps: list[str]) -> list[dict]:
+        """
+        Run *steps* in one round trip. Each step is exec'd in the bridge's
+        globals with its stdout captured, and the captured outputs come back
+        as one JSON array.
+        """
+        script = _TPL_BATCH.format(steps=steps)
+        return [self._decode_output(out) for out in self._send(script)["data"]]
+
+    def _send(self, src: str) -> dict:
+        """
+        Low-level helper: send *src* (must end with '\n') and return the
+        decoded 'output' of the JSON reply, raising on non-'ok' status.
+        """
+        # The body and its single trailing LF go out as two buffers in one
+        # write, so the script is never copied just to append the newline
+        payload = src.rstrip("\n").encode("utf-8")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending script to Isaac Sim:\n%s", src)
         
-        with socket.create_connection((self.host, self.port)) as sock:
-            sock.sendall(src.encode("utf-8"))
+        with self._connect() as sock:
+            _sendall_parts(sock, (payload, b"\n"))
             sock.shutdown(socket.SHUT_WR)       # signal "done writing"
 
-            # Receive until the server closes
-            data = bytearray()
-            while chunk := sock.recv(4096):
-                data.extend(chunk)
-            
-            raw_response = data.decode("utf-8")
-            logger.debug(f"Raw response from Isaac Sim:\n{raw_response}")
-            
-            if not raw_response.strip():
-                logger.error("Received empty response from Isaac Sim")
-                return json.dumps({"status": "success", "message": "Operation completed (no output)"})
-            
+            # Receive until the server closes, straight into one buffer that
+            # doubles when full instead of allocating a bytes object per chunk
+            buf = bytearray(_RECV_BUFSIZE)
+            size = 0
+            while n := sock.recv_into(memoryview(buf)[size:]):
+                size += n
+                if size == len(buf):
+                    buf.extend(bytes(len(buf)))
+            del buf[size:]
+        return self._parse_reply(buf)
+
+    def _parse_reply(self, raw_response: bytes | bytearray) -> dict:
+        """
+        Unwrap the bridge's ``{"status": "ok", "output": ...}`` envelope and
+        decode the script's own JSON reply, raising on non-'ok' status.
+        The raw bytes are parsed directly, without decoding to str first.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw response from Isaac Sim:\n%s", raw_response.decode("utf-8", "replace"))
+        
+        # isspace() stops at the first non-blank byte instead of copying
+        if not raw_response or raw_response.isspace():
+            logger.error("Received empty response from Isaac Sim")
+            return {"status": "success", "message": "Operation completed (no output)"}
+        
+        try:
+            response = _loads(raw_response)
+        except ValueError as e:
+            text = raw_response.decode("utf-8", "replace")
+            logger.error("Failed to decode response: %s", text)
+            logger.error("JSON decode error: %s", e)
+            # If we can't decode the response, wrap it in a success response
+            return {"status": "success", "message": text}
+
+        if response.get("status") != "ok":
+            error_msg = response.get("error", "Unknown error")
+            logger.error("Error from Isaac Sim: %s", error_msg)
+            raise RuntimeError(f"Isaac Sim error: {error_msg}")
+        return self._decode_output(response.get("output", ""))
+
+    @staticmethod
+    def _decode_output(output: str) -> dict:
+        """Decode what an injected script printed; plain text becomes a success message."""
+        if not output or output.isspace():
+            return {"status": "success", "message": "Operation completed successfully"}
+        try:
+            decoded = _loads(output)
+        except ValueError:
+            decoded = None
+        if isinstance(decoded, dict):
+            return decoded
+        # If output is not a JSON object, wrap it in a success response
+        return {"status": "success", "message": output.strip()}
+
+    # --------------------------------------------------------------------- #
+    # PRIVATE – asyncio variant of the transport
+    # --------------------------------------------------------------------- #
+    async def _aexec(self, src: str) -> dict:
+        """
+        Async counterpart of _send: same framing and reply handling, but the
+        connect, write and read yield to the event loop instead of blocking.
+        """
+        payload = src.rstrip("\n").encode("utf-8")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending script to Isaac Sim:\n%s", src)
+
+        sock = await self._aconnect()
+        reader, writer = await asyncio.open_connection(sock=sock)
+        try:
+            writer.writelines((payload, b"\n"))
+            await writer.drain()
+            writer.write_eof()                  # signal "done writing"
+            data = await reader.read()          # until the server closes
+        finally:
+            writer.close()
+            await writer.wait_closed()
+        return self._parse_reply(data)
+
+    async def _aconnect(self) -> socket.socket:
+        """Async counterpart of _connect: same address fallback, non-blocking connect."""
+        loop = asyncio.get_running_loop()
+        error: OSError | None = None
+        for info in self._addresses():
+            try:
+                sock = self._new_socket(info)
+            except OSError as e:
+                error = e
+                continue
+            try:
+                sock.setblocking(False)
+                await loop.sock_connect(sock, info[4])
+                self._quickack(sock)
+            except OSError as e:
+                sock.close()
+                error = e
+                continue
+            self._promote(info)
+            return sock
+        self._addrs = None      # resolve again next time, in case the host moved
+        raise error or OSError(f"getaddrinfo returned no addresses for {self.host}")
+
+    async def _acall_helper(self, call: str) -> dict:
+        """Async counterpart of _call_helper."""
+        for attempt in range(2):
+            if not self._helpers_ready:
+                await self._aexec(_SCRIPT_JOINT_HELPERS)
+                self._helpers_ready = True
             try:
-                response = json.loads(raw_response)
-                if response.get("status") != "ok":
-                    error_msg = response.get("error", "Unknown error")
-                    logger.error(f"Error from Isaac Sim: {error_msg}")
-                    raise RuntimeError(f"Isaac Sim error: {error_msg}")
-                
-                output = response.get("output", "")
-                if output:
-                    try:
-                        # Try to parse the output as JSON
-                        return output
-                    except json.JSONDecodeError:
-                        # If output is not JSON, wrap it in a success response
-                        return json.dumps({"status": "success", "message": output})
-                else:
-                    return json.dumps({"status": "success", "message": "Operation completed successfully"})
-                    
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode response: {raw_response}")
-                logger.error(f"JSON decode error: {str(e)}")
-                # If we can't decode the response, wrap it in a success response
-                return json.dumps({"status": "success", "message": raw_response})
+                return await self._aexec(call)
+            except RuntimeError as e:
+                if attempt or not _MISSING_HELPER.search(str(e)):
+                    raise
+                self._helpers_ready = False
@@ -3,70 +3,91 @@ Robot configurations for Isaac Sim DOF simulation.
 This file maps friendly robot names to their USD paths and metadata.
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True, slots=True)
+class RobotCfg:
+    """Static description of one robot asset."""
+    name: str
+    usd_path: str
+    prim_path: str
+    description: str
+
+
 ROBOT_CONFIGS = {
     # Manipulator Robots
-    "franka": {
-        "name": "Franka Emika Panda",
-        "usd_path": "https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Franka/franka.usd",
-        "prim_path": "/World/Franka",
-        "description": "7-DOF robotic arm with parallel gripper"
-    },
-    "ur5": {
-        "name": "Universal Robots UR5",
-        "usd_path": "https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/UniversalRobots/ur5/ur5.usd",
-        "prim_path": "/World/UR5",
-        "description": "6-DOF collaborative robot arm"
-    },
-    "kinova": {
-        "name": "Kinova Gen3",
-        "usd_path": "https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Kinova/Gen3/gen3n7_instanceable.usd",
-        "prim_path": "/World/Kinova",
-        "description": "7-DOF lightweight robotic arm"
-    },
-    "flexiv": {
-        "name": "Flexiv Rizon 4",
-        "usd_path": "https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Flexiv/Rizon4/flexiv_rizon4.usd",
-        "prim_path": "/World/FlexivRizon4",
-        "description": "7-DOF adaptive robotic arm"
-    },
+    "franka": RobotCfg(
+        name="Franka Emika Panda",
+        usd_path="https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Franka/franka.usd",
+        prim_path="/World/Franka",
+        description="7-DOF robotic arm with parallel gripper",
+    ),
+    "ur5": RobotCfg(
+        name="Universal Robots UR5",
+        usd_path="https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/UniversalRobots/ur5/ur5.usd",
+        prim_path="/World/UR5",
+        description="6-DOF collaborative robot arm",
+    ),
+    "kinova": RobotCfg(
+        name="Kinova Gen3",
+        usd_path="https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Kinova/Gen3/gen3n7_instanceable.usd",
+        prim_path="/World/Kinova",
+        description="7-DOF lightweight robotic arm",
+    ),
+    "flexiv": RobotCfg(
+        name="Flexiv Rizon 4",
+        usd_path="https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Flexiv/Rizon4/flexiv_rizon4.usd",
+        prim_path="/World/FlexivRizon4",
+        description="7-DOF adaptive robotic arm",
+    ),
     
     # Mobile Robots
-    "carter": {
-        "name": "NVIDIA Carter",
-        "usd_path": "https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Carter/carter_v1.usd",
-        "prim_path": "/World/Carter",
-        "description": "Differential drive mobile robot"
-    },
-    "jetbot": {
-        "name": "NVIDIA JetBot",
-        "usd_path": "https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Jetbot/jetbot.usd",
-        "prim_path": "/World/JetBot",
-        "description": "Educational AI robot platform"
-    },
+    "carter": RobotCfg(
+        name="NVIDIA Carter",
+        usd_path="https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Carter/carter_v1.usd",
+        prim_path="/World/Carter",
+        description="Differential drive mobile robot",
+    ),
+    "jetbot": RobotCfg(
+        name="NVIDIA JetBot",
+        usd_path="https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Jetbot/jetbot.usd",
+        prim_path="/World/JetBot",
+        description="Educational AI robot platform",
+    ),
     
     # Humanoid Robots
-    "digit": {
-        "name": "Agility Robotics Digit",
-        "usd_path": "https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Agility/Digit/digit_v4.usd",
-        "prim_path": "/World/Digit",
-        "description": "Bipedal humanoid robot"
-    }
+    "digit": RobotCfg(
+        name="Agility Robotics Digit",
+        usd_path="https://omniverse-content-production.s3-us-west-2.amazonaws.com/Assets/Isaac/4.5/Isaac/Robots/Agility/Digit/digit_v4.usd",
+        prim_path="/World/Digit",
+        description="Bipedal humanoid robot",
+    )
 }
 
-def get_robot_config(robot_name: str) -> dict:
+# Keys are already lower-case today; normalising here keeps lookups
+# case-insensitive if a mixed-case entry is ever added above.
+_ROBOT_CONFIGS_LOWER = {name.lower(): config for name, config in ROBOT_CONFIGS.items()}
+
+@lru_cache(maxsize=32)
+def get_robot_config(robot_name: str) -> RobotCfg:
     """Get robot configuration by name.
     
+    Results are memoized, so repeated calls from a control loop skip the
+    lower-casing and lookup.
+
     Args:
         robot_name: Name of the robot (case insensitive)
         
     Returns:
-        Dictionary containing robot configuration
+        RobotCfg describing the robot
         
     Raises:
         KeyError: If robot name is not found
     """
-    robot_name = robot_name.lower()
-    if robot_name not in ROBOT_CONFIGS:
+    config = _ROBOT_CONFIGS_LOWER.get(robot_name.lower())
+    if config is None:
         available = list(ROBOT_CONFIGS.keys())
-        raise KeyError(f"Robot '{robot_name}' not found. Available robots: {available}")
-    return ROBOT_CONFIGS[robot_name] 
\ No newline at end of file
+        raise KeyError(f"Robot '{robot_name.lower()}' not found. Available robots: {available}")
+    return config
\ No newline at end of file
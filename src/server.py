@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
 
 import asyncio
+from time import monotonic
 from mcp.server import Server, InitializationOptions, NotificationOptions
 import mcp.types as types
 from robot_configs import ROBOT_CONFIGS
 from dof import DOF
-import json
 import logging
 
+try:
+    # Optional: orjson serialises batch results and joint states faster than the stdlib
+    from orjson import dumps as _orjson_dumps
+
+    def _dumps(obj) -> str:
+        return _orjson_dumps(obj).decode()
+except ImportError:
+    from json import dumps as _json_dumps
+
+    def _dumps(obj) -> str:
+        return _json_dumps(obj, separators=(",", ":"))
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -16,31 +28,37 @@ logging.basicConfig(
 )
 
 logger = logging.getLogger(__name__)
+_info, _error, _debug = logger.info, logger.error, logger.debug
 
 server = Server("dof-sim")
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    # Get list of available robots for the dropdown
-    robot_choices = [{"title": config["name"], "value": robot_name} 
-                    for robot_name, config in ROBOT_CONFIGS.items()]
-    
-    return [
+# Available robots for the add_robot dropdown; ROBOT_CONFIGS is fixed at import
+_ROBOT_ENUM = tuple(ROBOT_CONFIGS)
+_ROBOT_ENUM_TITLES = tuple(config.name for config in ROBOT_CONFIGS.values())
+
+# Shared by every tool that takes no arguments; never mutated
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+
+_READ_CACHE_TTL = 0.05   # seconds a list_robots / get_robot_state reply is reused
+
+# Optional argument of the read-only tools
+_CACHE_TTL_PROPERTY = {
+    "type": "number",
+    "description": f"Seconds to reuse a recent identical reply (default {_READ_CACHE_TTL}, 0 disables)",
+    "minimum": 0
+}
+
+def _build_tool_list() -> list[types.Tool]:
+    tools = [
         types.Tool(
             name="add_ground",
             description="Add ground plane to Isaac Sim DOF simulation",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+            inputSchema=_EMPTY_SCHEMA,
         ),
         types.Tool(
             name="add_ball",
             description="Add ball object to Isaac Sim DOF simulation",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+            inputSchema=_EMPTY_SCHEMA,
         ),
         types.Tool(
             name="add_robot",
@@ -51,8 +69,8 @@ async def handle_list_tools() -> list[types.Tool]:
                     "robot_name": {
                         "type": "string",
                         "description": "Name of the robot to add",
-                        "enum": [choice["value"] for choice in robot_choices],
-                        "enumTitles": [choice["title"] for choice in robot_choices]
+                        "enum": _ROBOT_ENUM,
+                        "enumTitles": _ROBOT_ENUM_TITLES
                     }
                 },
                 "required": ["robot_name"]
@@ -63,7 +81,9 @@ async def handle_list_tools() -> list[types.Tool]:
             description="List all robots currently in the simulation",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "cache_ttl": _CACHE_TTL_PROPERTY
+                },
             },
         ),
         types.Tool(
@@ -113,161 +133,342 @@ async def handle_list_tools() -> list[types.Tool]:
                     "robot_name": {
                         "type": "string",
                         "description": "Name of the robot to query"
-                    }
+                    },
+                    "cache_ttl": _CACHE_TTL_PROPERTY
                 },
                 "required": ["robot_name"]
             },
         )
     ]
+    tools.append(
+        types.Tool(
+            name="batch_execute",
+            description=(
+                "Run several DOF tool calls in one request and return their results as JSON. "
+                "Calls run one at a time in list order unless maxConcurrent is raised, in which "
+                "case they overlap and may reach Isaac Sim in any order"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "calls": {
+                        "type": "array",
+                        "description": "Tool calls to run",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {
+                                    "type": "string",
+                                    "enum": [tool.name for tool in tools]
+                                },
+                                "arguments": {"type": "object"}
+                            },
+                            "required": ["name"]
+                        }
+                    },
+                    "maxConcurrent": {
+                        "type": "integer",
+                        "description": "Maximum number of calls in flight at once; above 1, "
+                                       "calls are unordered, so only raise it for independent calls",
+                        "minimum": 1,
+                        "default": 1
+                    },
+                    "stopOnError": {
+                        "type": "boolean",
+                        "description": "Skip calls that have not started once one fails",
+                        "default": False
+                    }
+                },
+                "required": ["calls"]
+            },
+        )
+    )
+    return tools
+
+# ROBOT_CONFIGS is fixed at import, so the tool catalog is built only once
+_TOOL_LIST = _build_tool_list()
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    return _TOOL_LIST
+
+# JSON schema type -> Python type(s) accepted for it
+_JSON_TYPES = {
+    "string": str,
+    "array": list,
+    "object": dict,
+    "boolean": bool,
+    "integer": int,
+    "number": (int, float),
+}
+
+def _compile(schema: dict, path: str = ""):
+    """
+    Turn a tool's JSON schema into a ``check(value, tool)`` function that
+    raises ValueError on a missing or mistyped value. Covers the subset the
+    tool schemas use: type, items, properties and required.
+    """
+    type_name = schema["type"]
+    kind = _JSON_TYPES[type_name]
+    numeric = type_name in ("integer", "number")
+    check_item = _compile(schema["items"], f"{path}[]") if "items" in schema else None
+    prefix = f"{path}." if path else ""
+    check_props = {
+        key: _compile(prop, prefix + key) for key, prop in schema.get("properties", {}).items()
+    }
+    required = tuple(schema.get("required", ()))
+
+    def check(value, tool: str) -> None:
+        # bool is an int subclass, but true/false is not a JSON number
+        if not isinstance(value, kind) or (numeric and isinstance(value, bool)):
+            where = f"Argument '{path}' for {tool}" if path else f"Arguments for {tool}"
+            raise ValueError(f"{where} must be of type {type_name}, got {type(value).__name__}")
+        if check_item is not None:
+            for item in value:
+                check_item(item, tool)
+        elif kind is dict:
+            missing = [prefix + key for key in required if value.get(key) is None]
+            if missing:
+                raise ValueError(f"Missing required arguments for {tool}: {', '.join(missing)}")
+            for key, item in value.items():
+                check_prop = check_props.get(key)
+                if check_prop is not None and item is not None:
+                    check_prop(item, tool)
+    return check
+
+# Per-tool argument checkers compiled from the schemas
+_ARG_CHECKS = {tool.name: _compile(tool.inputSchema) for tool in _TOOL_LIST}
+
+def _validate(name: str, arguments: dict) -> dict:
+    """
+    Check *arguments* against the required names and types in *name*'s
+    schema. An explicit null on an optional argument means "not given", so
+    such keys are dropped and handlers only ever see their defaults.
+    """
+    _ARG_CHECKS[name](arguments, name)
+    if any(value is None for value in arguments.values()):
+        arguments = {key: value for key, value in arguments.items() if value is not None}
+    return arguments
+
+# One DOF handle for the whole server, so its cached bridge address, stage
+# probe, joint helpers and per-robot calls survive between tool calls.
+# Its blocking calls run in worker threads via asyncio.to_thread so one
+# slow Isaac Sim round trip does not stall other tool calls
+_sim: DOF | None = None
+_sim_lock = asyncio.Lock()
+
+async def _get_sim() -> DOF:
+    global _sim
+    async with _sim_lock:
+        if _sim is None:
+            _sim = DOF()
+        return _sim
+
+# Replies that never vary, built once
+_RESP_GROUND = [types.TextContent(type="text", text="Ground added to DOF simulation")]
+_RESP_BALL = [types.TextContent(type="text", text="Ball added to DOF simulation")]
+_ADDED_MSG = {key: f"{config.name} added to DOF simulation" for key, config in ROBOT_CONFIGS.items()}
+_ADDED_RESP = {key: [types.TextContent(type="text", text=msg)] for key, msg in _ADDED_MSG.items()}
+
+# (tool, robot name) -> (time fetched, reply) for the read-only tools
+_READ_CACHE: dict[tuple[str, str | None], tuple[float, list[types.TextContent]]] = {}
+_READ_CACHE_MAX = 128
+# DOF methods that leave the scene alone; any other call drops _READ_CACHE
+_DOF_READS = frozenset({"list_robots", "get_joint_states"})
+# Bumped after every other DOF call; a read that saw a write land while
+# it was in flight does not store its (possibly pre-write) reply
+_write_gen = 0
+
+def _cache_ttl(arguments: dict) -> float:
+    # A missing or null cache_ttl means the default
+    ttl = arguments.get("cache_ttl")
+    return _READ_CACHE_TTL if ttl is None else ttl
+
+def _cache_get(key: tuple[str, str | None], ttl: float) -> list[types.TextContent] | None:
+    if ttl <= 0:
+        return None
+    entry = _READ_CACHE.get(key)
+    if entry is not None and monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+def _cache_put(
+    key: tuple[str, str | None], ttl: float, gen: int, response: list[types.TextContent]
+) -> list[types.TextContent]:
+    """Store *response* unless a write finished since *gen* was read from _write_gen."""
+    if ttl > 0 and gen == _write_gen:
+        if len(_READ_CACHE) >= _READ_CACHE_MAX:
+            _READ_CACHE.clear()
+        _READ_CACHE[key] = (monotonic(), response)
+    return response
+
+async def _sim_call(fn, *args) -> dict:
+    """Run a blocking DOF method in a worker thread and log its raw reply."""
+    global _write_gen
+    try:
+        result = await asyncio.to_thread(fn, *args)
+    finally:
+        if fn.__name__ not in _DOF_READS:
+            # The scene may have changed, even if the call failed part way
+            _write_gen += 1
+            _READ_CACHE.clear()
+    if logger.isEnabledFor(logging.DEBUG):
+        _debug("Raw response from %s: %s", fn.__name__, result)
+    return result
+
+def _ok(result: dict, error_text: str) -> dict:
+    """Return *result* if Isaac Sim reported success, else raise its message."""
+    if result.get("status") != "success":
+        raise ValueError(result.get("message", error_text))
+    return result
+
+# Failures a tool call is expected to hit: bad arguments or Isaac Sim
+# replies (ValueError), unknown robots (KeyError), script errors reported
+# by the bridge (RuntimeError) and an unreachable bridge (OSError)
+_TOOL_ERRORS = (ValueError, KeyError, RuntimeError, OSError)
+
+def _error_text(e: Exception) -> str:
+    # str() of a KeyError is the repr of its message, quotes included
+    return str(e.args[0]) if isinstance(e, KeyError) and e.args else str(e)
+
+def _message_or(result: dict, fallback: str, error_text: str) -> str:
+    """Isaac Sim's success message for *result*, or *fallback* if it sent none."""
+    return _ok(result, error_text).get("message") or fallback
+
+async def _h_add_ground(sim: DOF, arguments: dict) -> list[types.TextContent]:
+    _info("Adding ground plane...")
+    result = await _sim_call(sim.add_ground)  # Add ground plane for physics interactions
+    _ok(result, "Unknown error adding ground")
+    return _RESP_GROUND
+
+async def _h_add_ball(sim: DOF, arguments: dict) -> list[types.TextContent]:
+    _info("Adding ball...")
+    result = await _sim_call(sim.add_ball)  # Add ball object to the scene
+    _ok(result, "Unknown error adding ball")
+    return _RESP_BALL
+
+async def _h_add_robot(sim: DOF, arguments: dict) -> list[types.TextContent]:
+    robot_name = arguments["robot_name"]
+    _info(f"Adding robot {robot_name}...")
+    result = await _sim_call(sim.add_robot, robot_name)  # Add specified robot to the simulation
+    _ok(result, "Unknown error adding robot")
+    # DOF matches robot names case-insensitively; the table is keyed lower-case
+    return _ADDED_RESP[robot_name.lower()]
+
+async def _h_list_robots(sim: DOF, arguments: dict) -> list[types.TextContent]:
+    key, ttl = ("list_robots", None), _cache_ttl(arguments)
+    if (cached := _cache_get(key, ttl)) is not None:
+        return cached
+    gen = _write_gen
+    _info("Listing robots...")
+    result = await _sim_call(sim.list_robots)
+    _ok(result, "Unknown error listing robots")
+    # Handle both response formats
+    if "data" not in result:
+        # Handle the generic success message format
+        text = result.get("message", "No robots found in simulation")
+    elif robots := result["data"]:
+        text = f"Robots in simulation:\n" + "\n".join(robots)
+    else:
+        text = "No robots found in simulation"
+    return _cache_put(key, ttl, gen, [types.TextContent(type="text", text=text)])
+
+async def _h_set_robot_positions(sim: DOF, arguments: dict) -> list[types.TextContent]:
+    robot_name, positions = arguments["robot_name"], arguments["positions"]
+    _info(f"Setting positions for robot {robot_name}: {positions}")
+    result = await _sim_call(sim.set_joint_positions, robot_name, positions)
+    text = _message_or(result, f"Positions set for {robot_name}", "Unknown error setting positions")
+    return [types.TextContent(type="text", text=text)]
+
+async def _h_set_robot_velocities(sim: DOF, arguments: dict) -> list[types.TextContent]:
+    robot_name, velocities = arguments["robot_name"], arguments["velocities"]
+    _info(f"Setting velocities for robot {robot_name}: {velocities}")
+    result = await _sim_call(sim.set_joint_velocities, robot_name, velocities)
+    text = _message_or(result, f"Velocities set for {robot_name}", "Unknown error setting velocities")
+    return [types.TextContent(type="text", text=text)]
+
+async def _h_get_robot_state(sim: DOF, arguments: dict) -> list[types.TextContent]:
+    robot_name = arguments["robot_name"]
+    key, ttl = ("get_robot_state", robot_name), _cache_ttl(arguments)
+    if (cached := _cache_get(key, ttl)) is not None:
+        return cached
+    gen = _write_gen
+    _info(f"Getting state for robot {robot_name}")
+    result = await _sim_call(sim.get_joint_states, robot_name)
+    state = _ok(result, "Unknown error getting state").get("data")
+    if state is None:
+        raise ValueError("No state data received from Isaac Sim")
+    state_str = _dumps({"positions": state["positions"], "velocities": state["velocities"]})
+    return _cache_put(key, ttl, gen, [types.TextContent(type="text", text=f"Robot {robot_name} state:\n{state_str}")])
+
+async def _h_batch_execute(sim: DOF, arguments: dict) -> list[types.TextContent]:
+    calls = arguments["calls"]
+    # Missing or null options fall back to one call at a time / keep going
+    max_concurrent = arguments.get("maxConcurrent")
+    limit = asyncio.Semaphore(1 if max_concurrent is None else max(1, max_concurrent))
+    stop_on_error = bool(arguments.get("stopOnError"))
+    failed = False
+
+    async def run(call: dict) -> dict:
+        nonlocal failed
+        name = call.get("name")
+        async with limit:
+            if failed and stop_on_error:
+                return {"name": name, "status": "skipped", "result": None}
+            handler = _DISPATCH.get(name) if name != "batch_execute" else None
+            try:
+                if handler is None:
+                    raise ValueError(f"Unknown tool: {name}")
+                content = await handler(sim, _validate(name, call.get("arguments") or {}))
+            except _TOOL_ERRORS as e:
+                failed = True
+                _error(f"Error in batch_execute call {name}: {_error_text(e)}")
+                return {"name": name, "status": "error", "result": _error_text(e)}
+            except Exception as e:
+                failed = True
+                _error(f"Unexpected error in batch_execute call {name}: {str(e)}", exc_info=True)
+                return {"name": name, "status": "error", "result": str(e)}
+            return {"name": name, "status": "success", "result": "\n".join(c.text for c in content)}
+
+    _info(f"Running batch of {len(calls)} calls...")
+    results = await asyncio.gather(*(run(call) for call in calls))
+    return [types.TextContent(type="text", text=_dumps(results))]
+
+# Tool name -> handler; each handler gets the shared DOF handle and the
+# tool arguments, already checked by _validate()
+_DISPATCH = {
+    "add_ground": _h_add_ground,
+    "add_ball": _h_add_ball,
+    "add_robot": _h_add_robot,
+    "list_robots": _h_list_robots,
+    "set_robot_positions": _h_set_robot_positions,
+    "set_robot_velocities": _h_set_robot_velocities,
+    "get_robot_state": _h_get_robot_state,
+    "batch_execute": _h_batch_execute,
+}
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict | None) -> list[types.TextContent]:
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        _error(f"Unknown tool: {name}")
+        return [types.TextContent(type="text", text=f"Error: Unknown tool: {name}")]
     try:
-        # Initialize DOF simulation for Isaac Sim
-        sim = DOF()
-        
-        if name == "add_ground":
-            logger.info("Adding ground plane...")
-            result = sim.add_ground()    # Add ground plane for physics interactions
-            logger.info(f"Raw response from add_ground: {result}")
-            return [types.TextContent(type="text", text="Ground added to DOF simulation")]
-            
-        elif name == "add_ball":
-            logger.info("Adding ball...")
-            result = sim.add_ball()      # Add ball object to the scene
-            logger.info(f"Raw response from add_ball: {result}")
-            return [types.TextContent(type="text", text="Ball added to DOF simulation")]
-            
-        elif name == "add_robot":
-            robot_name = arguments.get("robot_name") if arguments else None
-            if not robot_name:
-                raise ValueError("Robot name must be specified")
-            logger.info(f"Adding robot {robot_name}...")
-            result = sim.add_robot(robot_name)  # Add specified robot to the simulation
-            logger.info(f"Raw response from add_robot: {result}")
-            try:
-                if result and result.strip():
-                    response = json.loads(result)
-                    logger.info(f"Decoded response: {response}")
-                    return [types.TextContent(type="text", text=f"{ROBOT_CONFIGS[robot_name]['name']} added to DOF simulation")]
-                else:
-                    logger.warning("Empty response from add_robot")
-                    return [types.TextContent(type="text", text=f"{ROBOT_CONFIGS[robot_name]['name']} added to DOF simulation")]
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode JSON response: {e}")
-                logger.error(f"Raw response was: '{result}'")
-                # If JSON decoding fails, still try to return a success message
-                return [types.TextContent(type="text", text=f"{ROBOT_CONFIGS[robot_name]['name']} added to DOF simulation")]
-
-        elif name == "list_robots":
-            logger.info("Listing robots...")
-            result = sim.list_robots()
-            logger.info(f"Raw response from list_robots: {result}")
-            try:
-                if result and result.strip():
-                    response = json.loads(result)
-                    if response["status"] == "success":
-                        # Handle both response formats
-                        if "data" in response:
-                            robots = response["data"]
-                            if robots:
-                                return [types.TextContent(type="text", text=f"Robots in simulation:\n" + "\n".join(robots))]
-                            else:
-                                return [types.TextContent(type="text", text="No robots found in simulation")]
-                        else:
-                            # Handle the generic success message format
-                            return [types.TextContent(type="text", text=response.get("message", "No robots found in simulation"))]
-                    else:
-                        raise ValueError(response.get("message", "Unknown error listing robots"))
-                else:
-                    logger.warning("Empty response from list_robots")
-                    return [types.TextContent(type="text", text="No robots found in simulation")]
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode JSON response: {e}")
-                logger.error(f"Raw response was: '{result}'")
-                raise ValueError("Failed to decode response from Isaac Sim")
-
-        elif name == "set_robot_positions":
-            robot_name = arguments.get("robot_name") if arguments else None
-            positions = arguments.get("positions") if arguments else None
-            if not robot_name or positions is None:
-                raise ValueError("Robot name and positions must be specified")
-            
-            logger.info(f"Setting positions for robot {robot_name}: {positions}")
-            result = sim.set_joint_positions(robot_name, positions)
-            logger.info(f"Raw response from set_joint_positions: {result}")
-            try:
-                if result and result.strip():
-                    response = json.loads(result)
-                    if response["status"] == "success":
-                        return [types.TextContent(type="text", text=response["message"])]
-                    else:
-                        raise ValueError(response.get("message", "Unknown error setting positions"))
-                else:
-                    logger.warning("Empty response from set_joint_positions")
-                    return [types.TextContent(type="text", text=f"Positions set for {robot_name}")]
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode JSON response: {e}")
-                logger.error(f"Raw response was: '{result}'")
-                return [types.TextContent(type="text", text=f"Positions set for {robot_name}")]
-
-        elif name == "set_robot_velocities":
-            robot_name = arguments.get("robot_name") if arguments else None
-            velocities = arguments.get("velocities") if arguments else None
-            if not robot_name or velocities is None:
-                raise ValueError("Robot name and velocities must be specified")
-            
-            logger.info(f"Setting velocities for robot {robot_name}: {velocities}")
-            result = sim.set_joint_velocities(robot_name, velocities)
-            logger.info(f"Raw response from set_joint_velocities: {result}")
-            try:
-                if result and result.strip():
-                    response = json.loads(result)
-                    if response["status"] == "success":
-                        return [types.TextContent(type="text", text=response["message"])]
-                    else:
-                        raise ValueError(response.get("message", "Unknown error setting velocities"))
-                else:
-                    logger.warning("Empty response from set_joint_velocities")
-                    return [types.TextContent(type="text", text=f"Velocities set for {robot_name}")]
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode JSON response: {e}")
-                logger.error(f"Raw response was: '{result}'")
-                return [types.TextContent(type="text", text=f"Velocities set for {robot_name}")]
-
-        elif name == "get_robot_state":
-            robot_name = arguments.get("robot_name") if arguments else None
-            if not robot_name:
-                raise ValueError("Robot name must be specified")
-            
-            logger.info(f"Getting state for robot {robot_name}")
-            result = sim.get_joint_states(robot_name)
-            logger.info(f"Raw response from get_joint_states: {result}")
-            try:
-                if result and result.strip():
-                    response = json.loads(result)
-                    if response["status"] == "success":
-                        state = response["data"]
-                        state_str = f"Positions: {state['positions']}\nVelocities: {state['velocities']}"
-                        return [types.TextContent(type="text", text=f"Robot {robot_name} state:\n{state_str}")]
-                    else:
-                        raise ValueError(response.get("message", "Unknown error getting state"))
-                else:
-                    logger.warning("Empty response from get_joint_states")
-                    raise ValueError("No response received from Isaac Sim")
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode JSON response: {e}")
-                logger.error(f"Raw response was: '{result}'")
-                raise ValueError("Failed to decode response from Isaac Sim")
-            
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-            
+        # Shared DOF handle for Isaac Sim
+        sim = await _get_sim()
+        return await handler(sim, _validate(name, arguments or {}))
+    except _TOOL_ERRORS as e:
+        # Expected failures: report them without a traceback
+        _error(f"Error in {name}: {_error_text(e)}")
+        return [types.TextContent(type="text", text=f"Error: {_error_text(e)}")]
     except Exception as e:
-        logger.error(f"Error in handle_call_tool: {str(e)}", exc_info=True)
+        _error(f"Unexpected error in handle_call_tool: {str(e)}", exc_info=True)
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
 async def main():
+    # The stdio transport stays the SDK's own: MCP clients speak newline-
+    # delimited JSON-RPC, and the SDK already validates each line with
+    # pydantic-core's native JSON parser
     from mcp.server.stdio import stdio_server
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
@@ -284,4 +485,10 @@ async def main():
         )
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        # Optional: uvloop's libuv event loop, where it is installed;
+        # uvloop.run() only exists from uvloop 0.18 on
+        from uvloop import run as _run
+    except ImportError:
+        _run = asyncio.run
+    _run(main())
\ No newline at end of file